@@ -1,263 +1,475 @@
 import os
 from pathlib import Path
-from unittest import mock
 
-import openai
-import openai.resources
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
-from openai.types import CreateEmbeddingResponse, Embedding
-from openai.types.chat import ChatCompletion, ChatCompletionChunk
-from openai.types.chat.chat_completion import (
-    ChatCompletionMessage,
-    Choice,
-)
-from openai.types.create_embedding_response import Usage
-from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from fastapi_app import create_app
-from fastapi_app.openai_clients import create_openai_embed_client
-from fastapi_app.postgres_engine import create_postgres_engine_from_env
-from fastapi_app.setup_postgres_database import create_db_schema
-from fastapi_app.setup_postgres_seeddata import seed_data
-from tests.data import test_data
-from tests.mocks import MockAzureCredential
+# Under pytest-xdist, each worker runs against its own copy of a seeded template database
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+POSTGRES_ADMIN_DATABASE = "postgres"
+POSTGRES_TEMPLATE_DATABASE = "postgres_seed_template"
+POSTGRES_TEMPLATE_LOCK_ID = 8154711
 
 POSTGRES_HOST = "localhost"
 POSTGRES_USERNAME = "admin"
-POSTGRES_DATABASE = "postgres"
+POSTGRES_DATABASE = f"postgres_{XDIST_WORKER}" if XDIST_WORKER else POSTGRES_ADMIN_DATABASE
 POSTGRES_PASSWORD = "postgres"
 POSTGRES_SSL = "prefer"
 POSTGRESQL_DATABASE_URL = (
     f"postgresql+asyncpg://{POSTGRES_USERNAME}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}/{POSTGRES_DATABASE}"
 )
 
+_ENV = {
+    # Database
+    "POSTGRES_HOST": POSTGRES_HOST,
+    "POSTGRES_USERNAME": POSTGRES_USERNAME,
+    "POSTGRES_DATABASE": POSTGRES_DATABASE,
+    "POSTGRES_PASSWORD": POSTGRES_PASSWORD,
+    "POSTGRES_SSL": POSTGRES_SSL,
+    "POSTGRESQL_DATABASE_URL": POSTGRESQL_DATABASE_URL,
+    "RUNNING_IN_PRODUCTION": "False",
+    # Azure Subscription
+    "AZURE_SUBSCRIPTION_ID": "test-storage-subid",
+    # Azure OpenAI
+    "OPENAI_CHAT_HOST": "azure",
+    "OPENAI_EMBED_HOST": "azure",
+    "AZURE_OPENAI_ENDPOINT": "https://api.openai.com",
+    "AZURE_OPENAI_VERSION": "2024-03-01-preview",
+    "AZURE_OPENAI_CHAT_DEPLOYMENT": "gpt-35-turbo",
+    "AZURE_OPENAI_CHAT_MODEL": "gpt-35-turbo",
+    "AZURE_OPENAI_EMBED_DEPLOYMENT": "text-embedding-ada-002",
+    "AZURE_OPENAI_EMBED_MODEL": "text-embedding-ada-002",
+    "AZURE_OPENAI_EMBED_MODEL_DIMENSIONS": "1536",
+    "AZURE_OPENAI_KEY": "fakekey",
+    # Allowed Origin
+    "ALLOWED_ORIGIN": "https://frontend.com",
+}
+
+# Keys that would change app behavior if inherited from the developer's shell
+_UNSET_ENV = (
+    "AZURE_USE_AUTHENTICATION",
+    "AZURE_OPENAI_EMBED_DIMENSIONS",
+    "APP_IDENTITY_ID",
+    "APPLICATIONINSIGHTS_CONNECTION_STRING",
+)
+
 
-@pytest.fixture(scope="session")
-def monkeypatch_session():
-    with pytest.MonkeyPatch.context() as monkeypatch_session:
-        yield monkeypatch_session
+_ANSWER_QUERY_FRANCE = "capital of France"
+_ANSWER_QUERY_RATES = "interest rates"
+_ANSWER_IMAGE = (
+    "From the provided sources, the impact of interest rates and GDP growth on "
+    "financial markets can be observed through the line graph. [Financial Market Analysis Report 2023-7.png]"
+)
+_ANSWER_FRANCE = "The capital of France is Paris. [Benefit_Options-2.pdf]."
+_ANSWER_FRANCE_FOLLOWUP = "The capital of France is Paris. [Benefit_Options-2.pdf]. <<What is the capital of Spain?>>"
+
+
+def _chat_completion_chunks(answer: str):
+    """Build the streamed chunks for an answer, validated once per session."""
+    from openai.types.chat import ChatCompletionChunk
+
+    chunk_id = "test-id"
+    model = "gpt-35-turbo"
+    responses = [
+        {"object": "chat.completion.chunk", "choices": [], "id": chunk_id, "model": model, "created": 1},
+        {
+            "object": "chat.completion.chunk",
+            "choices": [{"delta": {"role": "assistant"}, "index": 0, "finish_reason": None}],
+            "id": chunk_id,
+            "model": model,
+            "created": 1,
+        },
+    ]
+    # Split at << to simulate chunked responses
+    if answer.find("<<") > -1:
+        parts = answer.split("<<")
+        responses.append(
+            {
+                "object": "chat.completion.chunk",
+                "choices": [
+                    {
+                        "delta": {"role": "assistant", "content": parts[0] + "<<"},
+                        "index": 0,
+                        "finish_reason": None,
+                    }
+                ],
+                "id": chunk_id,
+                "model": model,
+                "created": 1,
+            }
+        )
+        responses.append(
+            {
+                "object": "chat.completion.chunk",
+                "choices": [{"delta": {"role": "assistant", "content": parts[1]}, "index": 0, "finish_reason": None}],
+                "id": chunk_id,
+                "model": model,
+                "created": 1,
+            }
+        )
+        responses.append(
+            {
+                "object": "chat.completion.chunk",
+                "choices": [{"delta": {"role": None, "content": None}, "index": 0, "finish_reason": "stop"}],
+                "id": chunk_id,
+                "model": model,
+                "created": 1,
+            }
+        )
+    else:
+        responses.append(
+            {
+                "object": "chat.completion.chunk",
+                "choices": [{"delta": {"content": answer}, "index": 0, "finish_reason": None}],
+                "id": chunk_id,
+                "model": model,
+                "created": 1,
+            }
+        )
+    return tuple(ChatCompletionChunk.model_validate(response) for response in responses)
+
+
+def _chat_completion(answer: str):
+    from openai.types.chat import ChatCompletion
+    from openai.types.chat.chat_completion import ChatCompletionMessage, Choice
+
+    return ChatCompletion(
+        object="chat.completion",
+        choices=[
+            Choice(message=ChatCompletionMessage(role="assistant", content=answer), finish_reason="stop", index=0)
+        ],
+        id="test-123",
+        created=0,
+        model="test-model",
+    )
+
+
+# Canned answers for the exact prompts the tests send, anything else falls back to _resolve_default
+_ANSWERS = {
+    "Generate search query for: What is the capital of France?": _ANSWER_QUERY_FRANCE,
+    "Generate search query for: Are interest rates high?": _ANSWER_QUERY_RATES,
+}
+_ALL_ANSWERS = (*_ANSWERS.values(), _ANSWER_IMAGE, _ANSWER_FRANCE, _ANSWER_FRANCE_FOLLOWUP)
+
+
+def _resolve_default(messages, last_question) -> str:
+    if isinstance(last_question, list) and last_question[2].get("image_url"):
+        return _ANSWER_IMAGE
+    if "Generate 3 very brief follow-up questions" in messages[0]["content"]:
+        return _ANSWER_FRANCE_FOLLOWUP
+    return _ANSWER_FRANCE
 
 
 @pytest.fixture(scope="session")
-def mock_session_env(monkeypatch_session):
+def mock_session_env():
     """Mock the environment variables for testing."""
-    with mock.patch.dict(os.environ, clear=True):
-        # Database
-        monkeypatch_session.setenv("POSTGRES_HOST", POSTGRES_HOST)
-        monkeypatch_session.setenv("POSTGRES_USERNAME", POSTGRES_USERNAME)
-        monkeypatch_session.setenv("POSTGRES_DATABASE", POSTGRES_DATABASE)
-        monkeypatch_session.setenv("POSTGRES_PASSWORD", POSTGRES_PASSWORD)
-        monkeypatch_session.setenv("POSTGRES_SSL", POSTGRES_SSL)
-        monkeypatch_session.setenv("POSTGRESQL_DATABASE_URL", POSTGRESQL_DATABASE_URL)
-        monkeypatch_session.setenv("RUNNING_IN_PRODUCTION", "False")
-        # Azure Subscription
-        monkeypatch_session.setenv("AZURE_SUBSCRIPTION_ID", "test-storage-subid")
-        # Azure OpenAI
-        monkeypatch_session.setenv("OPENAI_CHAT_HOST", "azure")
-        monkeypatch_session.setenv("OPENAI_EMBED_HOST", "azure")
-        monkeypatch_session.setenv("AZURE_OPENAI_ENDPOINT", "https://api.openai.com")
-        monkeypatch_session.setenv("AZURE_OPENAI_VERSION", "2024-03-01-preview")
-        monkeypatch_session.setenv("AZURE_OPENAI_CHAT_DEPLOYMENT", "gpt-35-turbo")
-        monkeypatch_session.setenv("AZURE_OPENAI_CHAT_MODEL", "gpt-35-turbo")
-        monkeypatch_session.setenv("AZURE_OPENAI_EMBED_DEPLOYMENT", "text-embedding-ada-002")
-        monkeypatch_session.setenv("AZURE_OPENAI_EMBED_MODEL", "text-embedding-ada-002")
-        monkeypatch_session.setenv("AZURE_OPENAI_EMBED_MODEL_DIMENSIONS", "1536")
-        monkeypatch_session.setenv("AZURE_OPENAI_KEY", "fakekey")
-        # Allowed Origin
-        monkeypatch_session.setenv("ALLOWED_ORIGIN", "https://frontend.com")
-
-        if os.getenv("AZURE_USE_AUTHENTICATION") is not None:
-            monkeypatch_session.delenv("AZURE_USE_AUTHENTICATION")
-        yield
+    saved = {key: os.environ.get(key) for key in (*_ENV, *_UNSET_ENV)}
+    os.environ.update(_ENV)
+    for key in _UNSET_ENV:
+        os.environ.pop(key, None)
+    yield
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
 
 
-async def create_and_seed_db():
-    """Create and seed the database."""
-    engine = await create_postgres_engine_from_env()
-    await create_db_schema(engine)
-    await seed_data(engine)
+async def create_test_engine(database: str):
+    from fastapi_app.postgres_engine import create_postgres_engine
+
+    return await create_postgres_engine(
+        host=POSTGRES_HOST,
+        username=POSTGRES_USERNAME,
+        database=database,
+        password=POSTGRES_PASSWORD,
+        sslmode=POSTGRES_SSL,
+        azure_credential=None,
+    )
+
+
+def seed_items_count() -> int:
+    import json
+
+    import fastapi_app
+
+    with open(Path(fastapi_app.__file__).parent / "seed_data.json") as f:
+        return len(json.load(f))
+
+
+async def seed_db(database: str):
+    """Create and seed a database, skipping whatever a previous run already did."""
+    from sqlalchemy import text
+
+    from fastapi_app.setup_postgres_database import create_db_schema
+    from fastapi_app.setup_postgres_seeddata import seed_data
+
+    engine = await create_test_engine(database)
+    async with engine.connect() as conn:
+        has_schema = await conn.scalar(text("SELECT to_regclass('public.items')")) is not None
+        items_count = await conn.scalar(text("SELECT count(*) FROM items")) if has_schema else 0
+    if not has_schema:
+        await create_db_schema(engine)
+    # seed_data fills in missing items by id, so a partial or outdated seed is topped up
+    if items_count != seed_items_count():
+        await seed_data(engine)
     await engine.dispose()
 
 
+def seed_fingerprint() -> str:
+    """Hash the seed data and the models, stored on the template database to detect when it is outdated."""
+    import hashlib
+
+    import fastapi_app
+
+    package_dir = Path(fastapi_app.__file__).parent
+    digest = hashlib.sha256()
+    for file_name in ("seed_data.json", "postgres_models.py"):
+        digest.update((package_dir / file_name).read_bytes())
+    return digest.hexdigest()
+
+
+async def create_and_seed_db():
+    """Create and seed the database.
+
+    Under pytest-xdist, the template database is seeded once (workers take turns via an advisory lock)
+    and each worker's database is a fresh copy of it, which Postgres makes with a file-level clone.
+    The template is rebuilt whenever its fingerprint comment no longer matches seed_fingerprint().
+    """
+    from sqlalchemy import text
+
+    if XDIST_WORKER is None:
+        await seed_db(POSTGRES_DATABASE)
+        return
+
+    admin_engine = await create_test_engine(POSTGRES_ADMIN_DATABASE)
+    async with admin_engine.execution_options(isolation_level="AUTOCOMMIT").connect() as conn:
+        await conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": POSTGRES_TEMPLATE_LOCK_ID})
+        try:
+            fingerprint = seed_fingerprint()
+            template = await conn.execute(
+                text("SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = :name"),
+                {"name": POSTGRES_TEMPLATE_DATABASE},
+            )
+            template_row = template.first()
+            if template_row is None or template_row[0] != fingerprint:
+                await conn.execute(text(f'DROP DATABASE IF EXISTS "{POSTGRES_TEMPLATE_DATABASE}" WITH (FORCE)'))
+                await conn.execute(text(f'CREATE DATABASE "{POSTGRES_TEMPLATE_DATABASE}"'))
+                await conn.execute(text(f"COMMENT ON DATABASE \"{POSTGRES_TEMPLATE_DATABASE}\" IS '{fingerprint}'"))
+            await seed_db(POSTGRES_TEMPLATE_DATABASE)
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{POSTGRES_DATABASE}" WITH (FORCE)'))
+            await conn.execute(text(f'CREATE DATABASE "{POSTGRES_DATABASE}" TEMPLATE "{POSTGRES_TEMPLATE_DATABASE}"'))
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": POSTGRES_TEMPLATE_LOCK_ID})
+    await admin_engine.dispose()
+
+
+async def drop_db(database: str):
+    """Drop a database, used to clean up the per-worker copies made under pytest-xdist."""
+    from sqlalchemy import text
+
+    admin_engine = await create_test_engine(POSTGRES_ADMIN_DATABASE)
+    async with admin_engine.execution_options(isolation_level="AUTOCOMMIT").connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+    await admin_engine.dispose()
+
+
 @pytest_asyncio.fixture(scope="session")
-async def app(mock_session_env):
-    """Create a FastAPI app."""
+async def _database(mock_session_env):
+    """Make sure the test database exists and is seeded."""
+    await create_and_seed_db()
+    yield
+    if XDIST_WORKER is not None:
+        await drop_db(POSTGRES_DATABASE)
+
+
+@pytest.fixture(scope="session")
+def _frontend_static():
+    """Skip app tests before any database work when the frontend hasn't been built."""
     if not Path("src/backend/static/").exists():
         pytest.skip("Please generate frontend files first!")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def app(_frontend_static, mock_session_env, _database):
+    """Create a FastAPI app."""
+    from fastapi_app import create_app
+
     app = create_app(testing=True)
-    await create_and_seed_db()
     return app
 
 
 @pytest.fixture(scope="session")
-def mock_openai_embedding(monkeypatch_session):
-    async def mock_acreate(*args, **kwargs):
-        return CreateEmbeddingResponse(
-            object="list",
-            data=[
-                Embedding(
-                    embedding=test_data.embeddings,
-                    index=0,
-                    object="embedding",
-                )
-            ],
-            model="text-embedding-ada-002",
-            usage=Usage(prompt_tokens=8, total_tokens=8),
-        )
+def mock_openai_embedding():
+    import openai.resources
+    from openai.types import CreateEmbeddingResponse, Embedding
+    from openai.types.create_embedding_response import Usage
+
+    from tests.data import test_data
+
+    # model_construct skips validation, so the 1536-float list is shared by reference rather than copied
+    response = CreateEmbeddingResponse.model_construct(
+        object="list",
+        data=[
+            Embedding.model_construct(
+                embedding=test_data.embeddings,
+                index=0,
+                object="embedding",
+            )
+        ],
+        model="text-embedding-ada-002",
+        usage=Usage.model_construct(prompt_tokens=8, total_tokens=8),
+    )
 
-    monkeypatch_session.setattr(openai.resources.AsyncEmbeddings, "create", mock_acreate)
+    async def mock_acreate(*args, **kwargs):
+        return response
 
+    original_acreate = openai.resources.AsyncEmbeddings.create
+    setattr(openai.resources.AsyncEmbeddings, "create", mock_acreate)
     yield
+    setattr(openai.resources.AsyncEmbeddings, "create", original_acreate)
 
 
 @pytest.fixture(scope="session")
-def mock_openai_chatcompletion(monkeypatch_session):
+def mock_openai_chatcompletion():
+    import openai.resources
+
+    prebuilt = {answer: _chat_completion_chunks(answer) for answer in _ALL_ANSWERS}
+    prebuilt_full = {answer: _chat_completion(answer) for answer in _ALL_ANSWERS}
+
     class AsyncChatCompletionIterator:
         def __init__(self, answer: str):
-            chunk_id = "test-id"
-            model = "gpt-35-turbo"
-            self.responses = [
-                {"object": "chat.completion.chunk", "choices": [], "id": chunk_id, "model": model, "created": 1},
-                {
-                    "object": "chat.completion.chunk",
-                    "choices": [{"delta": {"role": "assistant"}, "index": 0, "finish_reason": None}],
-                    "id": chunk_id,
-                    "model": model,
-                    "created": 1,
-                },
-            ]
-            # Split at << to simulate chunked responses
-            if answer.find("<<") > -1:
-                parts = answer.split("<<")
-                self.responses.append(
-                    {
-                        "object": "chat.completion.chunk",
-                        "choices": [
-                            {
-                                "delta": {"role": "assistant", "content": parts[0] + "<<"},
-                                "index": 0,
-                                "finish_reason": None,
-                            }
-                        ],
-                        "id": chunk_id,
-                        "model": model,
-                        "created": 1,
-                    }
-                )
-                self.responses.append(
-                    {
-                        "object": "chat.completion.chunk",
-                        "choices": [
-                            {"delta": {"role": "assistant", "content": parts[1]}, "index": 0, "finish_reason": None}
-                        ],
-                        "id": chunk_id,
-                        "model": model,
-                        "created": 1,
-                    }
-                )
-                self.responses.append(
-                    {
-                        "object": "chat.completion.chunk",
-                        "choices": [{"delta": {"role": None, "content": None}, "index": 0, "finish_reason": "stop"}],
-                        "id": chunk_id,
-                        "model": model,
-                        "created": 1,
-                    }
-                )
-            else:
-                self.responses.append(
-                    {
-                        "object": "chat.completion.chunk",
-                        "choices": [{"delta": {"content": answer}, "index": 0, "finish_reason": None}],
-                        "id": chunk_id,
-                        "model": model,
-                        "created": 1,
-                    }
-                )
+            self._chunks = prebuilt[answer]
+            self._i = 0
 
         def __aiter__(self):
             return self
 
         async def __anext__(self):
-            if self.responses:
-                return ChatCompletionChunk.model_validate(self.responses.pop(0))
+            if self._i < len(self._chunks):
+                chunk = self._chunks[self._i]
+                self._i += 1
+                return chunk
             else:
                 raise StopAsyncIteration
 
     async def mock_acreate(*args, **kwargs):
         messages = kwargs["messages"]
         last_question = messages[-1]["content"]
-        if last_question == "Generate search query for: What is the capital of France?":
-            answer = "capital of France"
-        elif last_question == "Generate search query for: Are interest rates high?":
-            answer = "interest rates"
-        elif isinstance(last_question, list) and last_question[2].get("image_url"):
-            answer = "From the provided sources, the impact of interest rates and GDP growth on "
-            "financial markets can be observed through the line graph. [Financial Market Analysis Report 2023-7.png]"
+        if isinstance(last_question, str) and last_question in _ANSWERS:
+            answer = _ANSWERS[last_question]
         else:
-            answer = "The capital of France is Paris. [Benefit_Options-2.pdf]."
-            if messages[0]["content"].find("Generate 3 very brief follow-up questions") > -1:
-                answer = "The capital of France is Paris. [Benefit_Options-2.pdf]. <<What is the capital of Spain?>>"
+            answer = _resolve_default(messages, last_question)
         if "stream" in kwargs and kwargs["stream"] is True:
             return AsyncChatCompletionIterator(answer)
         else:
-            return ChatCompletion(
-                object="chat.completion",
-                choices=[
-                    Choice(
-                        message=ChatCompletionMessage(role="assistant", content=answer), finish_reason="stop", index=0
-                    )
-                ],
-                id="test-123",
-                created=0,
-                model="test-model",
-            )
-
-    monkeypatch_session.setattr(openai.resources.chat.completions.AsyncCompletions, "create", mock_acreate)
+            return prebuilt_full[answer]
 
+    original_acreate = openai.resources.chat.completions.AsyncCompletions.create
+    setattr(openai.resources.chat.completions.AsyncCompletions, "create", mock_acreate)
     yield
+    setattr(openai.resources.chat.completions.AsyncCompletions, "create", original_acreate)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mock_default_azure_credential(mock_session_env):
     """Mock the Azure credential for testing."""
-    with mock.patch("azure.identity.DefaultAzureCredential") as mock_default_azure_credential:
-        mock_default_azure_credential.return_value = MockAzureCredential()
-        yield mock_default_azure_credential
+    import azure.identity
 
+    from tests.mocks import MockDefaultAzureCredential
 
-@pytest_asyncio.fixture(scope="function")
-async def test_client(app, mock_default_azure_credential, mock_openai_embedding, mock_openai_chatcompletion):
+    monkeypatch = pytest.MonkeyPatch()
+    try:
+        # Substitute a class rather than a factory so that annotations such as
+        # `DefaultAzureCredential | ManagedIdentityCredential` still evaluate at import time
+        monkeypatch.setattr(azure.identity, "DefaultAzureCredential", MockDefaultAzureCredential)
+        yield MockDefaultAzureCredential()
+    finally:
+        monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def test_client(app, mock_default_azure_credential, mock_openai_embedding, mock_openai_chatcompletion):
     """Create a test client."""
+    from fastapi.testclient import TestClient
+
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session(mock_session_env, mock_default_azure_credential):
-    """Create a new database session with a rollback at the end of the test."""
+@pytest_asyncio.fixture(scope="session")
+async def _engine(mock_session_env, _database):
+    """Create a single database engine shared by the whole test session."""
+    from fastapi_app.postgres_engine import create_postgres_engine_from_env
+
     engine = await create_postgres_engine_from_env()
-    async_sesion = async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = async_sesion()
-    await session.begin()
-    yield session
-    await session.rollback()
-    await session.close()
+    yield engine
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def _connection(_engine):
+    """Open a single connection with an outer transaction that is never committed."""
+    conn = await _engine.connect()
+    transaction = await conn.begin()
+    yield conn
+    await transaction.rollback()
+    await conn.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _sessionmaker(_connection):
+    """Create a single sessionmaker bound to the shared connection."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(
+        bind=_connection,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
 @pytest_asyncio.fixture(scope="function")
-async def postgres_searcher(mock_session_env, mock_default_azure_credential, db_session, mock_openai_embedding):
-    from fastapi_app.postgres_searcher import PostgresSearcher
+async def db_session(_connection, _sessionmaker):
+    """Create a new database session inside a SAVEPOINT that is rolled back at the end of the test."""
+    savepoint = await _connection.begin_nested()
+    session = _sessionmaker()
+    yield session
+    await session.close()
+    await savepoint.rollback()
 
-    openai_embed_client = await create_openai_embed_client(mock_default_azure_credential)
 
-    yield PostgresSearcher(
+@pytest_asyncio.fixture(scope="session")
+async def _embed_client(mock_default_azure_credential):
+    """Create a single OpenAI embeddings client for the session."""
+    from fastapi_app.openai_clients import create_openai_embed_client
+
+    return await create_openai_embed_client(mock_default_azure_credential)
+
+
+def create_postgres_searcher(db_session, openai_embed_client):
+    from fastapi_app.postgres_searcher import PostgresSearcher
+
+    return PostgresSearcher(
         db_session=db_session,
         openai_embed_client=openai_embed_client,
         embed_deployment="text-embedding-ada-002",
         embed_model="text-embedding-ada-002",
         embed_dimensions=1536,
     )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def postgres_searcher(_embed_client, mock_openai_embedding, db_session):
+    """Create a PostgresSearcher around the per-test database session."""
+    return create_postgres_searcher(db_session, _embed_client)
+
+
+@pytest.fixture(scope="function")
+def postgres_searcher_without_db(_embed_client):
+    """Create a PostgresSearcher for pure-logic tests, its unbound session never connects to Postgres."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return create_postgres_searcher(AsyncSession(), _embed_client)
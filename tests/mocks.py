@@ -32,3 +32,17 @@ class MockAzureCredentialExpired(TokenCredential):
             return AccessToken("", 0)
         else:
             return AccessToken("", 9999999999)
+
+
+class MockDefaultAzureCredential(MockAzureCredential):
+    """Stands in for azure.identity.DefaultAzureCredential, every construction returns one shared instance."""
+
+    _instance: "MockDefaultAzureCredential | None" = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "MockDefaultAzureCredential":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
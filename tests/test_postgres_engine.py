@@ -22,7 +22,7 @@ async def test_create_postgres_engine(mock_session_env, mock_default_azure_crede
     )
     assert engine.url.host == "localhost"
     assert engine.url.username == "admin"
-    assert engine.url.database == "postgres"
+    assert engine.url.database == POSTGRES_DATABASE
     assert engine.url.password == "postgres"
     assert engine.url.query["ssl"] == "prefer"
 
@@ -34,7 +34,7 @@ async def test_create_postgres_engine_from_env(mock_session_env, mock_default_az
     )
     assert engine.url.host == "localhost"
     assert engine.url.username == "admin"
-    assert engine.url.database == "postgres"
+    assert engine.url.database == POSTGRES_DATABASE
     assert engine.url.password == "postgres"
     assert engine.url.query["ssl"] == "prefer"
 
@@ -58,6 +58,6 @@ async def test_create_postgres_engine_from_args(mock_default_azure_credential):
     )
     assert engine.url.host == "localhost"
     assert engine.url.username == "admin"
-    assert engine.url.database == "postgres"
+    assert engine.url.database == POSTGRES_DATABASE
     assert engine.url.password == "postgres"
     assert engine.url.query["ssl"] == "prefer"
@@ -4,13 +4,15 @@ from fastapi_app.api_models import ItemPublic
 from tests.data import test_data
 
 
-def test_postgres_build_filter_clause_without_filters(postgres_searcher):
-    assert postgres_searcher.build_filter_clause(None) == ("", "")
-    assert postgres_searcher.build_filter_clause([]) == ("", "")
+def test_postgres_build_filter_clause_without_filters(postgres_searcher_without_db):
+    assert postgres_searcher_without_db.build_filter_clause(None) == ("", "")
+    assert postgres_searcher_without_db.build_filter_clause([]) == ("", "")
 
 
-def test_postgres_build_filter_clause_with_filters(postgres_searcher):
-    assert postgres_searcher.build_filter_clause([{"column": "id", "comparison_operator": "=", "value": 1}]) == (
+def test_postgres_build_filter_clause_with_filters(postgres_searcher_without_db):
+    assert postgres_searcher_without_db.build_filter_clause(
+        [{"column": "id", "comparison_operator": "=", "value": 1}]
+    ) == (
         "WHERE id = 1",
         "AND id = 1",
     )